@@ -23,19 +23,33 @@ Data source:
 
 import argparse
 import csv
+import functools
+import gzip
+import hashlib
+import http.client
 import io
 import json
 import platform
 import smtplib
 import subprocess
 import sys
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, timedelta
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
+from email.message import EmailMessage
+from pathlib import Path
 from typing import Optional
 from urllib.error import HTTPError, URLError
-from urllib.parse import urlencode
-from urllib.request import Request, urlopen
+from urllib.parse import urlencode, urljoin, urlsplit
+from urllib.request import Request, getproxies, proxy_bypass, urlopen
+
+# orjson is a drop-in, much faster parser for the number-heavy NOAA payloads;
+# fall back to the stdlib when it isn't installed.
+try:
+    import orjson as _json
+except ImportError:  # pragma: no cover - depends on environment
+    _json = json  # type: ignore[assignment]
 
 # ---------------------------------------------------------------------------
 # Configuration
@@ -57,7 +71,129 @@ STATIONS = [
 DEFAULT_STATION_ID = STATIONS[0][0]
 DEFAULT_STATION_NAME = STATIONS[0][1]
 
+# Upper bound on concurrent HTTP requests.
+FETCH_WORKERS = 4
+HTTP_TIMEOUT = 30                # seconds
+
+# Parsed NCEI month chunks are cached on disk once they can no longer change.
+# NCEI backfills late COOP reports for a while, so a month only counts as
+# settled once it ended CACHE_SETTLE_DAYS ago.
+CACHE_DIR = Path("~/.cache/noaa-rainfall").expanduser()
+CACHE_SETTLE_DAYS = 14
+
+
+# ---------------------------------------------------------------------------
+# HTTP (keep-alive connection pool shared by NCEI and IEM fetches)
+# ---------------------------------------------------------------------------
+
+_HTTP_HEADERS = {
+    "Accept": "application/json",
+    "Accept-Encoding": "gzip",   # JSON responses compress ~10x
+    "Connection": "keep-alive",
+}
+
+# Idle connections keyed by (scheme, host).  Reusing them skips a TCP + TLS
+# handshake for every chunk/month after the first.
+_HTTP_POOL: dict[tuple[str, str], list[http.client.HTTPConnection]] = {}
+_HTTP_POOL_LOCK = threading.Lock()
+
+# Caps in-flight requests (and so open connections per host) across every
+# caller, however many thread pools are fetching at once.
+_HTTP_SLOTS = threading.BoundedSemaphore(FETCH_WORKERS)
+
+_HTTP_MAX_REDIRECTS = 5
+
+
+def _http_acquire(scheme: str, host: str) -> http.client.HTTPConnection:
+    """Pop an idle pooled connection for *host*, or open a new one."""
+    with _HTTP_POOL_LOCK:
+        idle = _HTTP_POOL.get((scheme, host))
+        if idle:
+            return idle.pop()
+    if scheme == "https":
+        return http.client.HTTPSConnection(host, timeout=HTTP_TIMEOUT)
+    return http.client.HTTPConnection(host, timeout=HTTP_TIMEOUT)
+
+
+def _http_release(scheme: str, host: str, conn: http.client.HTTPConnection) -> None:
+    """Return *conn* to the pool, keeping at most FETCH_WORKERS per host."""
+    with _HTTP_POOL_LOCK:
+        idle = _HTTP_POOL.setdefault((scheme, host), [])
+        if len(idle) < FETCH_WORKERS:
+            idle.append(conn)
+            return
+    conn.close()
+
+
+def _http_uses_proxy(scheme: str, host: str) -> bool:
+    """True if the environment routes *scheme*://*host* through a proxy."""
+    return scheme in getproxies() and not proxy_bypass(host)
+
+
+def _http_get_via_urlopen(url: str) -> tuple[int, str, http.client.HTTPMessage, bytes]:
+    """Proxy path: plain urlopen, which honours HTTP(S)_PROXY and redirects."""
+    headers = {k: v for k, v in _HTTP_HEADERS.items() if k != "Connection"}
+    with urlopen(Request(url, headers=headers), timeout=HTTP_TIMEOUT) as resp:
+        return resp.status, resp.reason, resp.headers, resp.read()
+
+
+def _http_get_pooled(url: str) -> tuple[int, str, http.client.HTTPMessage, bytes]:
+    """One GET over a pooled keep-alive connection; redirects not followed."""
+    parts = urlsplit(url)
+    path = f"{parts.path}?{parts.query}" if parts.query else parts.path
+
+    # A pooled connection may have been closed by the server while idle;
+    # retry once on a fresh connection before giving up.
+    for attempt in range(2):
+        conn = _http_acquire(parts.scheme, parts.netloc)
+        reused = conn.sock is not None
+        try:
+            conn.request("GET", path, headers=_HTTP_HEADERS)
+            resp = conn.getresponse()
+            body = resp.read()
+        except (http.client.HTTPException, OSError) as exc:
+            conn.close()
+            if reused and attempt == 0:
+                continue
+            raise URLError(exc) from exc
+        break
+
+    if resp.will_close:
+        conn.close()
+    else:
+        _http_release(parts.scheme, parts.netloc, conn)
+    return resp.status, resp.reason, resp.headers, body
 
+
+def _http_get(url: str) -> bytes:
+    """GET *url* and return the (gzip-decoded) response body.
+
+    Requests go over a pooled keep-alive connection.  Redirects are
+    followed, and when HTTP(S)_PROXY applies to the host the request is
+    handed to urlopen instead, so proxies keep working.  Raises HTTPError
+    for non-2xx responses and URLError for network failures, like urlopen.
+    """
+    for _ in range(_HTTP_MAX_REDIRECTS + 1):
+        parts = urlsplit(url)
+        with _HTTP_SLOTS:
+            if _http_uses_proxy(parts.scheme, parts.hostname or ""):
+                status, reason, headers, body = _http_get_via_urlopen(url)
+            else:
+                status, reason, headers, body = _http_get_pooled(url)
+
+        if status in (301, 302, 303, 307, 308) and headers.get("Location"):
+            url = urljoin(url, headers["Location"])
+            continue
+        if not 200 <= status < 300:
+            raise HTTPError(url, status, reason, headers, None)
+        if headers.get("Content-Encoding", "").lower() == "gzip":
+            body = gzip.decompress(body)
+        return body
+
+    raise HTTPError(url, status, "too many redirects", headers, None)
+
+
+@functools.lru_cache(maxsize=16)
 def _rain_season_start(today: date) -> date:
     """Return October 1 of the current rain season.
 
@@ -69,74 +205,203 @@ def _rain_season_start(today: date) -> date:
     return date(today.year - 1, 10, 1)
 
 
-def fetch_rainfall(start: date, end: date, station_id: str = DEFAULT_STATION_ID,
-                   debug: bool = False) -> list[dict]:
-    """Fetch daily precipitation from the NOAA NCEI public API.
+def _cache_path(station_id: str, start: date, end: date) -> Path:
+    """Return the on-disk cache file for one station/date-range chunk."""
+    key = hashlib.sha1(f"{station_id}:{start}:{end}".encode()).hexdigest()
+    return CACHE_DIR / f"{key}.json.gz"
 
-    Returns a list of dicts with keys: date, precipitation_in.
-    The API caps at ~one year per call, so we chunk if needed.
-    """
-    all_records: list[dict] = []
-    chunk_start = start
 
-    while chunk_start <= end:
-        # API allows roughly one year per request
-        chunk_end = min(end, chunk_start.replace(year=chunk_start.year + 1) - timedelta(days=1))
+def _cache_load(path: Path) -> Optional[tuple[list[str], list[float]]]:
+    """Read a cached (dates, precipitation) pair, or None on a miss / bad file."""
+    try:
+        data = _json.loads(gzip.decompress(path.read_bytes()))
+    except (OSError, EOFError, ValueError):
+        return None
+    if not isinstance(data, dict) or "date" not in data or "precipitation_in" not in data:
+        return None
+    return data["date"], data["precipitation_in"]
 
-        params = {
-            "dataset": DATASET,
-            "dataTypes": DATA_TYPES,
-            "stations": station_id,
-            "startDate": chunk_start.isoformat(),
-            "endDate": chunk_end.isoformat(),
-            "format": "json",
-            "units": UNITS,
-        }
 
-        url = f"{NOAA_API_BASE}?{urlencode(params)}"
-        req = Request(url, headers={"Accept": "application/json"})
+def _cache_store(path: Path, dates: list[str], prcp: list[float]) -> None:
+    """Write a chunk to the cache.  Best effort — failures are ignored."""
+    payload = {"date": dates, "precipitation_in": prcp}
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_bytes(gzip.compress(json.dumps(payload).encode()))
+        tmp.replace(path)
+    except OSError:
+        pass
 
-        try:
-            with urlopen(req, timeout=30) as resp:
-                body = resp.read().decode()
-        except HTTPError as exc:
-            print(f"Error: NOAA API returned HTTP {exc.code}", file=sys.stderr)
-            print(f"URL: {url}", file=sys.stderr)
-            sys.exit(1)
-        except URLError as exc:
-            print(f"Error: Could not reach NOAA API: {exc.reason}", file=sys.stderr)
-            sys.exit(1)
 
+def _fetch_noaa_range(station_id: str, range_start: date, range_end: date,
+                      debug: bool = False) -> Optional[tuple[list[str], list[float]]]:
+    """Fetch and parse one NCEI request (at most a year).
+
+    Returns parallel (dates, precipitation_in) lists rather than per-day
+    dicts; fetch_rainfall builds the dicts once, after merging all ranges.
+    Returns None if the body could not be decoded.  HTTP and network
+    errors propagate to fetch_rainfall, which reports them once.
+    """
+    params = {
+        "dataset": DATASET,
+        "dataTypes": DATA_TYPES,
+        "stations": station_id,
+        "startDate": range_start.isoformat(),
+        "endDate": range_end.isoformat(),
+        "format": "json",
+        "units": UNITS,
+    }
+    url = f"{NOAA_API_BASE}?{urlencode(params)}"
+
+    body = _http_get(url)
+
+    if debug:
+        print(f"DEBUG URL: {url}", file=sys.stderr)
+        print(f"DEBUG response ({len(body)} bytes): "
+              f"{body[:500].decode(errors='replace')}", file=sys.stderr)
+
+    # Parsed in one shot rather than streamed: a request is capped at a year
+    # of one station's PRCP (<= 366 records, ~25 KB of JSON), so there is
+    # no large body to stream.
+    try:
+        data = _json.loads(body)
+    except _json.JSONDecodeError:
+        # Empty response means no data for that range (e.g., future dates)
         if debug:
-            print(f"DEBUG URL: {url}", file=sys.stderr)
-            print(f"DEBUG response ({len(body)} bytes): {body[:500]}", file=sys.stderr)
+            print(f"DEBUG: JSONDecodeError, body was: {body[:500]!r}", file=sys.stderr)
+        return None
 
-        try:
-            data = json.loads(body)
-        except json.JSONDecodeError:
-            # Empty response means no data for that range (e.g., future dates)
-            if debug:
-                print(f"DEBUG: JSONDecodeError, body was: {body[:500]!r}", file=sys.stderr)
-            data = []
-
-        if isinstance(data, dict):
-            # Single record comes back as a dict instead of a list
-            data = [data]
-
-        for rec in data:
-            rec_date = rec.get("DATE", "")[:10]
-            prcp = rec.get("PRCP")
-            if rec_date and prcp is not None:
-                all_records.append({
-                    "date": rec_date,
-                    "precipitation_in": float(prcp),
-                })
+    if isinstance(data, dict):
+        # Single record comes back as a dict instead of a list
+        data = [data]
+
+    dates: list[str] = []
+    values: list[float] = []
+    for rec in data:
+        rec_date = rec.get("DATE", "")[:10]
+        prcp = rec.get("PRCP")
+        if rec_date and prcp is not None:
+            dates.append(rec_date)
+            values.append(float(prcp))
+    return dates, values
+
+
+def _month_chunks(start: date, end: date) -> list[tuple[date, date]]:
+    """Split [start, end] at calendar-month boundaries."""
+    chunks: list[tuple[date, date]] = []
+    chunk_start = start
+    while chunk_start <= end:
+        if chunk_start.month == 12:
+            next_month = date(chunk_start.year + 1, 1, 1)
+        else:
+            next_month = date(chunk_start.year, chunk_start.month + 1, 1)
+        chunks.append((chunk_start, min(end, next_month - timedelta(days=1))))
+        chunk_start = next_month
+    return chunks
+
+
+def _year_chunks(start: date, end: date) -> list[tuple[date, date]]:
+    """Split [start, end] into ranges of at most a year (the API's cap).
 
+    Each range ends on a month boundary, so no calendar month is split
+    across two requests and each cached month comes from one response.
+    """
+    chunks: list[tuple[date, date]] = []
+    chunk_start = start
+    while chunk_start <= end:
+        next_start = date(chunk_start.year + 1, chunk_start.month, 1)
+        chunk_end = min(end, next_start - timedelta(days=1))
+        chunks.append((chunk_start, chunk_end))
         chunk_start = chunk_end + timedelta(days=1)
+    return chunks
 
-    # Sort chronologically
-    all_records.sort(key=lambda r: r["date"])
-    return all_records
+
+def fetch_rainfall(start: date, end: date, station_id: str = DEFAULT_STATION_ID,
+                   debug: bool = False, use_cache: bool = True) -> list[dict]:
+    """Fetch daily precipitation from the NOAA NCEI public API.
+
+    Returns a list of dicts with keys: date, precipitation_in.
+
+    Months that ended more than CACHE_SETTLE_DAYS ago no longer change, so
+    their parsed records are cached per month under CACHE_DIR.  Cached
+    months are read from disk; everything else is fetched in (at most)
+    year-long requests, concurrently, and any settled months in the
+    response are written back to the cache.  use_cache=False skips the
+    cache reads but still refreshes the stored months.
+    """
+    settled_before = date.today() - timedelta(days=CACHE_SETTLE_DAYS)
+    dates: list[str] = []
+    prcp: list[float] = []
+
+    # Serve settled months from the cache; collect contiguous runs of the
+    # remaining months to fetch.
+    runs: list[list[date]] = []
+    uncached: dict[str, tuple[date, date]] = {}  # "YYYY-MM" -> month chunk
+    prev_missing = False
+    for m_start, m_end in _month_chunks(start, end):
+        cached = None
+        if m_end < settled_before:
+            if use_cache:
+                cached = _cache_load(_cache_path(station_id, m_start, m_end))
+            if cached is None:
+                uncached[m_start.isoformat()[:7]] = (m_start, m_end)
+        if cached is not None:
+            if debug:
+                print(f"DEBUG cache hit: {station_id} {m_start} – {m_end}",
+                      file=sys.stderr)
+            dates.extend(cached[0])
+            prcp.extend(cached[1])
+            prev_missing = False
+        elif prev_missing:
+            runs[-1][1] = m_end
+        else:
+            runs.append([m_start, m_end])
+            prev_missing = True
+
+    ranges = [c for run_start, run_end in runs for c in _year_chunks(run_start, run_end)]
+
+    # Fold each range's columns in as ex.map yields it (in submission order)
+    # rather than first building a list of every result.  ex.map still
+    # submits all ranges up front and holds any that finish early.
+    # The first failure is reported once, here in the calling thread, and
+    # any ranges not yet started are cancelled.
+    ex = ThreadPoolExecutor(max_workers=FETCH_WORKERS)
+    try:
+        for result in ex.map(
+            lambda r: _fetch_noaa_range(station_id, r[0], r[1], debug), ranges,
+        ):
+            if result is None:
+                continue  # undecodable — treat as no data, cache nothing
+            dates.extend(result[0])
+            prcp.extend(result[1])
+
+            # Store the settled months covered by this response (ranges end
+            # on month boundaries, so each month is complete here).  Months
+            # with no records are never stored: they are more likely a
+            # hiccup or a pending backfill than a month with no reports.
+            by_month: dict[str, tuple[list[str], list[float]]] = {}
+            for d, v in zip(*result):
+                if d[:7] in uncached:
+                    m_dates, m_prcp = by_month.setdefault(d[:7], ([], []))
+                    m_dates.append(d)
+                    m_prcp.append(v)
+            for key, (m_dates, m_prcp) in by_month.items():
+                m_start, m_end = uncached[key]
+                _cache_store(_cache_path(station_id, m_start, m_end), m_dates, m_prcp)
+    except HTTPError as exc:
+        print(f"Error: NOAA API returned HTTP {exc.code}", file=sys.stderr)
+        print(f"URL: {exc.filename}", file=sys.stderr)
+        sys.exit(1)
+    except URLError as exc:
+        print(f"Error: Could not reach NOAA API: {exc.reason}", file=sys.stderr)
+        sys.exit(1)
+    finally:
+        ex.shutdown(wait=False, cancel_futures=True)
+
+    # Sort chronologically, then build the public list-of-dicts in one go
+    order = sorted(range(len(dates)), key=dates.__getitem__)
+    return [{"date": dates[i], "precipitation_in": prcp[i]} for i in order]
 
 
 # ---------------------------------------------------------------------------
@@ -168,14 +433,12 @@ def fetch_rainfall_iem(station_icao: str, network: str,
             "month": str(cur.month),
         }
         url = f"{IEM_API_BASE}?{urlencode(params)}"
-        req = Request(url, headers={"Accept": "application/json"})
 
         if debug:
             print(f"DEBUG IEM URL: {url}", file=sys.stderr)
 
         try:
-            with urlopen(req, timeout=30) as resp:
-                body = resp.read().decode()
+            body = _http_get(url)
         except (HTTPError, URLError) as exc:
             # Non-fatal: IEM is a supplementary source.
             if debug:
@@ -188,8 +451,8 @@ def fetch_rainfall_iem(station_icao: str, network: str,
             continue
 
         try:
-            data = json.loads(body)
-        except json.JSONDecodeError:
+            data = _json.loads(body)
+        except _json.JSONDecodeError:
             data = {}
 
         for rec in data.get("data", []):
@@ -226,17 +489,43 @@ def merge_rainfall_records(primary: list[dict],
     return merged
 
 
+# English month and weekday names for report labels; indexing these avoids
+# a strftime (and locale lookup) per month and per daily row.
+_MONTH_NAMES = (
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December",
+)
+_DOW = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")  # date.weekday() order
+
+
+@functools.lru_cache(maxsize=32)
+def _month_label(yyyymm: str) -> str:
+    """Return e.g. "October 2025" for a "2025-10" month key."""
+    return f"{_MONTH_NAMES[int(yyyymm[5:7]) - 1]} {yyyymm[:4]}"
+
+
+# Precomputed daily-detail bars (one "#" per 0.1 in), shared across rows.
+# Days above 10 in fall back to building the string.
+_BARS = tuple("#" * n for n in range(101))
+
+
 def format_report(records: list[dict], season_start: date, today: date,
                   station_id: str = DEFAULT_STATION_ID,
-                  station_name: str = DEFAULT_STATION_NAME) -> str:
-    """Build a human-readable rainfall report."""
+                  station_name: str = DEFAULT_STATION_NAME,
+                  generated_at: Optional[datetime] = None) -> str:
+    """Build a human-readable rainfall report.
+
+    *generated_at* is the timestamp shown in the header (default: now).
+    """
+    if generated_at is None:
+        generated_at = datetime.now()
     lines: list[str] = []
 
     lines.append("=" * 62)
     lines.append(f"  NOAA Daily Rainfall Report — {station_name}")
     lines.append(f"  Rain season: {season_start.strftime('%b %d, %Y')} – {today.strftime('%b %d, %Y')}")
     lines.append(f"  Station: {station_id}")
-    lines.append(f"  Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}")
+    lines.append(f"  Generated: {generated_at.strftime('%Y-%m-%d %H:%M')}")
     lines.append("=" * 62)
     lines.append("")
 
@@ -244,20 +533,16 @@ def format_report(records: list[dict], season_start: date, today: date,
         lines.append("  No precipitation data available for this period.")
         return "\n".join(lines)
 
-    # Monthly summaries
-    monthly: dict[str, float] = {}
-    for r in records:
-        month_key = r["date"][:7]  # YYYY-MM
-        monthly[month_key] = monthly.get(month_key, 0) + r["precipitation_in"]
-
-    total = sum(r["precipitation_in"] for r in records)
-    rainy_days = sum(1 for r in records if r["precipitation_in"] > 0)
+    # Monthly summaries (same aggregation the HTML dashboard uses)
+    summary = _compute_summary(records, today)
+    monthly: dict[str, float] = summary["monthly"]
+    total: float = summary["total"]
+    rainy_days: int = summary["rainy_days"]
 
     lines.append("  MONTHLY TOTALS")
     lines.append("  " + "-" * 30)
     for month_key in sorted(monthly):
-        dt = datetime.strptime(month_key, "%Y-%m")
-        label = dt.strftime("%B %Y")
+        label = _month_label(month_key)
         lines.append(f"  {label:<20s}  {monthly[month_key]:6.2f} in")
     lines.append("  " + "-" * 30)
     lines.append(f"  {'Season total':<20s}  {total:6.2f} in")
@@ -271,10 +556,10 @@ def format_report(records: list[dict], season_start: date, today: date,
     lines.append("  " + "-" * 40)
 
     for r in records:
-        dt = datetime.strptime(r["date"], "%Y-%m-%d")
-        day_name = dt.strftime("%a")
+        day_name = _DOW[date.fromisoformat(r["date"]).weekday()]
         val = r["precipitation_in"]
-        bar = "#" * int(val * 10) if val > 0 else ""
+        n = int(val * 10) if val > 0 else 0
+        bar = _BARS[n] if n < len(_BARS) else "#" * n
         marker = f"  {r['date']}  {day_name:<5s} {val:8.2f}    {bar}"
         lines.append(marker)
 
@@ -287,9 +572,9 @@ def format_report(records: list[dict], season_start: date, today: date,
 def output_csv(records: list[dict]) -> str:
     """Return records as CSV text."""
     buf = io.StringIO()
-    writer = csv.DictWriter(buf, fieldnames=["date", "precipitation_in"])
-    writer.writeheader()
-    writer.writerows(records)
+    writer = csv.writer(buf)
+    writer.writerow(("date", "precipitation_in"))
+    writer.writerows((r["date"], r["precipitation_in"]) for r in records)
     return buf.getvalue()
 
 
@@ -441,25 +726,27 @@ document.querySelectorAll('.src-btn').forEach(btn => {
 
 def _compute_summary(records: list[dict], today: date) -> dict:
     """Compute season summary stats from a list of daily records."""
-    total = sum(r["precipitation_in"] for r in records)
-    rainy_days = sum(1 for r in records if r["precipitation_in"] > 0)
-    monthly: dict[str, float] = {}
-    for r in records:
-        key = r["date"][:7]  # YYYY-MM
-        monthly[key] = monthly.get(key, 0) + r["precipitation_in"]
+    # One pass over the records; they are sorted, so the last rainy record
+    # seen is the most recent one.
+    total = 0.0
+    rainy_days = 0
+    monthly: defaultdict[str, float] = defaultdict(float)
     last_rain: Optional[dict] = None
-    for r in reversed(records):
-        if r["precipitation_in"] > 0:
+    for r in records:
+        v = r["precipitation_in"]
+        total += v
+        monthly[r["date"][:7]] += v  # YYYY-MM
+        if v > 0:
+            rainy_days += 1
             last_rain = r
-            break
     days_since_rain: Optional[int] = None
     if last_rain:
-        last_dt = datetime.strptime(last_rain["date"], "%Y-%m-%d").date()
+        last_dt = date.fromisoformat(last_rain["date"])
         days_since_rain = (today - last_dt).days
     return {
         "total": total,
         "rainy_days": rainy_days,
-        "monthly": monthly,
+        "monthly": dict(monthly),
         "last_rain": last_rain,
         "days_since_rain": days_since_rain,
     }
@@ -635,6 +922,10 @@ def render_html(sources: list[dict], season_start: date, season_end: date,
 # ---------------------------------------------------------------------------
 
 KEYCHAIN_SERVICE = "noaa-rainfall-tracker"
+# All SMTP settings are stored as one JSON blob under this account, so
+# loading them costs a single `security` call.  Older setups stored one
+# account per setting; those are still read as a fallback.
+KEYCHAIN_SMTP_ACCOUNT = "smtp_all"
 
 
 def _keychain_set(account: str, password: str) -> None:
@@ -690,11 +981,13 @@ def setup_email() -> None:
         sys.exit(1)
     smtp_from = input(f"From address [{smtp_user}]: ").strip() or smtp_user
 
-    _keychain_set("smtp_host", smtp_host)
-    _keychain_set("smtp_port", smtp_port)
-    _keychain_set("smtp_user", smtp_user)
-    _keychain_set("smtp_pass", smtp_pass)
-    _keychain_set("smtp_from", smtp_from)
+    _keychain_set(KEYCHAIN_SMTP_ACCOUNT, json.dumps({
+        "smtp_host": smtp_host,
+        "smtp_port": smtp_port,
+        "smtp_user": smtp_user,
+        "smtp_pass": smtp_pass,
+        "from_addr": smtp_from,
+    }))
 
     print(f"\nCredentials saved to Keychain (service: \"{KEYCHAIN_SERVICE}\").")
     print(f"You can now run:  python noaa_rainfall.py --email {smtp_user}")
@@ -706,6 +999,25 @@ def _get_smtp_credentials() -> dict:
 
     # Try macOS Keychain first
     if platform.system() == "Darwin":
+        blob = _keychain_get(KEYCHAIN_SMTP_ACCOUNT)
+        if blob:
+            try:
+                stored = json.loads(blob)
+            except json.JSONDecodeError:
+                stored = {}
+            if not isinstance(stored, dict):
+                stored = {}  # hand-edited / unexpected entry: use legacy lookup
+            if stored.get("smtp_pass"):
+                smtp_user = stored.get("smtp_user") or ""
+                return {
+                    "smtp_host": stored.get("smtp_host") or "smtp.gmail.com",
+                    "smtp_port": int(stored.get("smtp_port") or "587"),
+                    "smtp_user": smtp_user,
+                    "smtp_pass": stored["smtp_pass"],
+                    "from_addr": stored.get("from_addr") or smtp_user,
+                }
+
+        # Legacy layout: one Keychain account per setting
         smtp_pass = _keychain_get("smtp_pass")
         if smtp_pass:
             return {
@@ -752,28 +1064,29 @@ def send_email(report: str, to_addr: str) -> None:
         sys.exit(1)
 
     today_str = date.today().strftime("%b %d, %Y")
-    msg = MIMEMultipart("alternative")
+    msg = EmailMessage()
     msg["Subject"] = f"Palo Alto Rainfall Update — {today_str}"
     msg["From"] = creds["from_addr"]
     msg["To"] = to_addr
 
-    # Plain text part
-    msg.attach(MIMEText(report, "plain"))
-
-    # Simple HTML part (preformatted)
-    html = (
+    # Plain text part, with a simple preformatted HTML alternative
+    # Force a 7-bit-safe transfer encoding: the report contains non-ASCII
+    # (em dashes), and set_content would otherwise pick raw 8bit.
+    msg.set_content(report, cte="quoted-printable")
+    msg.add_alternative(
         "<html><body>"
         f"<pre style='font-family:monospace;font-size:13px'>{report}</pre>"
-        "</body></html>"
+        "</body></html>",
+        subtype="html",
+        cte="quoted-printable",
     )
-    msg.attach(MIMEText(html, "html"))
 
     with smtplib.SMTP(creds["smtp_host"], creds["smtp_port"]) as server:
         server.ehlo()
         server.starttls()
         server.ehlo()
         server.login(creds["smtp_user"], creds["smtp_pass"])
-        server.sendmail(creds["from_addr"], [to_addr], msg.as_string())
+        server.send_message(msg, creds["from_addr"], [to_addr])
 
     print(f"Report emailed to {to_addr}")
 
@@ -808,6 +1121,12 @@ def main() -> None:
     parser.add_argument("--json", action="store_true", help="Output raw JSON.")
     parser.add_argument("--csv", action="store_true", help="Output CSV.")
     parser.add_argument("--debug", action="store_true", help="Show raw API response.")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Re-download past months instead of reading them from the "
+             f"on-disk cache ({CACHE_DIR}); refreshes the cache.",
+    )
     parser.add_argument(
         "--station",
         type=str,
@@ -826,7 +1145,8 @@ def main() -> None:
         setup_email()
         return
 
-    today = date.today()
+    now = datetime.now()
+    today = now.date()
     season_start = _rain_season_start(today)
 
     start = datetime.strptime(args.start, "%Y-%m-%d").date() if args.start else season_start
@@ -842,10 +1162,13 @@ def main() -> None:
     used_id = stations_to_try[0][0]
     used_name = stations_to_try[0][1]
 
+    # Stations are tried one at a time; fetch_rainfall already parallelizes
+    # within a station, and the first station usually has data.
     for sid, sname in stations_to_try:
         print(f"Fetching rainfall data for {sname} ({sid})...", file=sys.stderr)
         print(f"Period: {start} to {end}", file=sys.stderr)
-        records = fetch_rainfall(start, end, station_id=sid, debug=args.debug)
+        records = fetch_rainfall(start, end, station_id=sid, debug=args.debug,
+                                 use_cache=not args.no_cache)
         if records:
             used_id, used_name = sid, sname
             break
@@ -858,7 +1181,8 @@ def main() -> None:
         print(output_csv(records), end="")
     else:
         report = format_report(records, start, end,
-                               station_id=used_id, station_name=used_name)
+                               station_id=used_id, station_name=used_name,
+                               generated_at=now)
         print(report)
 
         if args.email: